@@ -1,84 +1,69 @@
 #Q1.py
+import filecmp
 import os
+from functools import lru_cache
+
 
 RAW_FILE = "raw_text.txt"
 ENC_FILE = "encrypted_text.txt"
 DEC_FILE = "decrypted_text.txt"
 
-
-def shift_lower_first(c, k): 
-    idx = (ord(c) - ord('a') + (k % 13)) % 13
-    return chr(ord('a') + idx)
-
-def shift_lower_second(c, k): 
-    idx = (ord(c) - ord('n') + (k % 13)) % 13
-    return chr(ord('n') + idx)
-
-def shift_upper_first(c, k):  
-    idx = (ord(c) - ord('A') + (k % 13)) % 13
-    return chr(ord('A') + idx)
-
-def shift_upper_second(c, k):  
-    idx = (ord(c) - ord('N') + (k % 13)) % 13
-    return chr(ord('N') + idx)
-
-# encryption rules apply different shift formulas depending on
-# letter case and whether the letter is in the first or second half of the alphabet.
-def encrypt_character(ch, shift1, shift2):
-    prod = shift1 * shift2
-    ssum = shift1 + shift2
-
-    if 'a' <= ch <= 'z':
-        if ch <= 'm':            
-            return shift_lower_first(ch, +prod)
-        else:                     
-            return shift_lower_second(ch, -ssum)
-    elif 'A' <= ch <= 'Z':
-        if ch <= 'M':             
-            return shift_upper_first(ch, -shift1)
-        else:                      
-            return shift_upper_second(ch, +(shift2 * shift2))
-    else:
-        return ch  
-
-#decryption reverses the encryption shifts using opposite signs.
-def decrypt_character(ch, shift1, shift2):
-    prod = shift1 * shift2
-    ssum = shift1 + shift2
-
-    if 'a' <= ch <= 'z':
-        if ch <= 'm':             
-            return shift_lower_first(ch, -prod)
-        else:                     
-            return shift_lower_second(ch, +ssum)
-    elif 'A' <= ch <= 'Z':
-        if ch <= 'M':             
-            return shift_upper_first(ch, +shift1)
-        else:                     
-            return shift_upper_second(ch, -(shift2 * shift2))
-    else:
-        return ch  
+CHUNK_SIZE = 1 << 20  # 1 MiB read/translate/write blocks
+
+
+# The cipher shifts each half-alphabet (a-m, n-z, A-M, N-Z) within itself
+# by an amount derived from the key: +shift1*shift2, -(shift1+shift2),
+# -shift1 and +shift2^2 respectively (signs flipped for decryption).
+# build_cipher partially evaluates those rules for a fixed key into a
+# 256-entry byte translation table, so the whole transform is a single
+# bytes.translate. Every byte outside the four letter regions (including
+# all UTF-8 continuation bytes, which are >= 0x80) maps to itself, so the
+# table is safe on raw UTF-8 data too. Tables are memoized per key so
+# repeated encrypt/decrypt calls from module users don't rebuild them
+# (each cached entry is only 256 bytes).
+@lru_cache(maxsize=64)
+def build_cipher(shift1, shift2, decrypt=False):
+    regions = (
+        (ord('a'), +(shift1 * shift2)),  # a-m
+        (ord('n'), -(shift1 + shift2)),  # n-z
+        (ord('A'), -shift1),             # A-M
+        (ord('N'), +(shift2 * shift2)),  # N-Z
+    )
+    sign = -1 if decrypt else 1
+    tbl = bytearray(range(256))
+    for base, shift in regions:
+        for off in range(13):
+            tbl[base + off] = base + (off + sign * shift) % 13
+    return bytes(tbl)
+
+
+def _transform(buf, shift1, shift2, decrypt=False):
+    return buf.translate(build_cipher(shift1, shift2, decrypt))
+
+
+# Stream the files through the translation table in fixed-size chunks so
+# peak memory stays bounded no matter how large the input is. The table
+# leaves every byte >= 0x80 unchanged, so translating raw UTF-8 chunk by
+# chunk never corrupts a multi-byte sequence even when one straddles a
+# chunk boundary.
+def _translate_file(src, dst, table):
+    with open(src, "rb") as fi, open(dst, "wb") as fo:
+        while chunk := fi.read(CHUNK_SIZE):
+            fo.write(chunk.translate(table))
 
 
 def encrypt_file(shift1, shift2):
-    with open(RAW_FILE, "r", encoding="utf-8") as f:
-        text = f.read()
-    enc = ''.join(encrypt_character(c, shift1, shift2) for c in text)
-    with open(ENC_FILE, "w", encoding="utf-8") as f:
-        f.write(enc)
+    _translate_file(RAW_FILE, ENC_FILE, build_cipher(shift1, shift2))
     print("Encryption complete. Output written to 'encrypted_text.txt'.")
 
 def decrypt_file(shift1, shift2):
-    with open(ENC_FILE, "r", encoding="utf-8") as f:
-        text = f.read()
-    dec = ''.join(decrypt_character(c, shift1, shift2) for c in text)
-    with open(DEC_FILE, "w", encoding="utf-8") as f:
-        f.write(dec)
+    _translate_file(ENC_FILE, DEC_FILE, build_cipher(shift1, shift2, decrypt=True))
     print("Decryption complete. Output written to 'decrypted_text.txt'.")
 
 def verify_files():
-    with open(RAW_FILE, "r", encoding="utf-8") as f1, open(DEC_FILE, "r", encoding="utf-8") as f2:
-        same = f1.read() == f2.read()
+    # block-by-block compare with a small fixed buffer that stops at the
+    # first mismatch, instead of hashing (or loading) both files fully
+    same = filecmp.cmp(RAW_FILE, DEC_FILE, shallow=False)
     if same:
         print("Decryption Successful: Original and decrypted files match.")
     else:
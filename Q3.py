@@ -1,41 +1,93 @@
 import turtle
-import math
 
-def draw_edge(t, length, depth):
+import numpy as np
+
+# L-system for the fractal edge: each 'F' (draw one unit) expands to
+# F R F L F R F, where 'R' is a 60-degree right turn and 'L' a
+# 120-degree left turn (the inward indentation).
+_EDGE_RULE = ('F', 'R', 'F', 'L', 'F', 'R', 'F')
+
+def expand_edge(depth):
     """
-    Recursive function to draw one edge of the fractal polygon.
-    :param t: turtle object
-    :param length: length of the current segment
+    Iteratively expand the L-system for one edge into a flat token list,
+    avoiding the recursive call tree (4^depth Python frames).
+    :param depth: recursion depth
+    :return: list of 'F'/'R'/'L' tokens
+    """
+    tokens = ['F']
+    for _ in range(depth):
+        new_tokens = []
+        for tok in tokens:
+            if tok == 'F':
+                new_tokens.extend(_EDGE_RULE)
+            else:
+                new_tokens.append(tok)
+        tokens = new_tokens
+    return tokens
+
+def edge_offsets(tokens, unit):
+    """
+    Per-segment (dx, dy) offsets for a single edge drawn at heading 0.
+    :param tokens: token list from expand_edge
+    :param unit: length of one 'F' segment
+    :return: (dx, dy) arrays, one entry per segment
+    """
+    # turn applied just before each segment (right turns are negative,
+    # matching turtle's counter-clockwise heading convention)
+    turns = []
+    pending = 0.0
+    for tok in tokens:
+        if tok == 'F':
+            turns.append(pending)
+            pending = 0.0
+        elif tok == 'R':
+            pending -= 60.0
+        else:
+            pending += 120.0
+
+    dirs = np.cumsum(np.radians(turns))
+    return unit * np.cos(dirs), unit * np.sin(dirs)
+
+def polygon_points(sides, length, depth, start=(0.0, 0.0), heading=0.0):
+    """
+    Precompute every vertex of the fractal polygon. All sides are the
+    same edge, so its offsets are expanded once and each side just
+    rotates and translates the same arrays.
+    :param sides: number of sides of initial polygon
+    :param length: side length
     :param depth: recursion depth
+    :param start: starting (x, y) position
+    :param heading: starting heading in degrees
+    :return: (xs, ys) arrays of vertices after the start point
     """
-    if depth == 0:
-        t.forward(length)
-    else:
-        length /= 3.0
-        # 1st segment
-        draw_edge(t, length, depth - 1)
-        # turn right for equilateral triangle pointing inward
-        t.right(60)
-        draw_edge(t, length, depth - 1)
-        # turn left twice the angle (forming indentation inward)
-        t.left(120)
-        draw_edge(t, length, depth - 1)
-        # turn back right
-        t.right(60)
-        draw_edge(t, length, depth - 1)
+    unit = length / 3.0 ** depth
+    dx0, dy0 = edge_offsets(expand_edge(depth), unit)
+
+    xs_parts, ys_parts = [], []
+    x, y = start
+    for i in range(sides):
+        # rotate the shared edge to this side's heading
+        h = np.radians(heading - i * 360.0 / sides)
+        cos_h, sin_h = np.cos(h), np.sin(h)
+        xs = x + np.cumsum(cos_h * dx0 - sin_h * dy0)
+        ys = y + np.cumsum(sin_h * dx0 + cos_h * dy0)
+        xs_parts.append(xs)
+        ys_parts.append(ys)
+        x, y = xs[-1], ys[-1]
+    return np.concatenate(xs_parts), np.concatenate(ys_parts)
 
 def draw_polygon(t, sides, length, depth):
     """
-    Draws the fractal polygon.
+    Draws the fractal polygon by streaming the precomputed vertices
+    through t.goto, leaving no per-segment trig or turtle state updates.
     :param t: turtle object
     :param sides: number of sides of initial polygon
     :param length: side length
     :param depth: recursion depth
     """
-    angle = 360.0 / sides
-    for _ in range(sides):
-        draw_edge(t, length, depth)
-        t.right(angle)
+    xs, ys = polygon_points(sides, length, depth, t.position(), t.heading())
+    for x, y in zip(xs, ys):
+        t.goto(x, y)
 
 # ---- Main Program ----
 if __name__ == "__main__":
@@ -55,6 +107,10 @@ if __name__ == "__main__":
     # Setup turtle
     screen = turtle.Screen()
     screen.title("Recursive Geometric Pattern")
+    # batch all drawing into a single screen update at the end, with no
+    # per-primitive animation delay
+    screen.tracer(0, 0)
+    screen.delay(0)
     t = turtle.Turtle()
     t.speed(0)  # fastest
 
@@ -67,5 +123,6 @@ if __name__ == "__main__":
     draw_polygon(t, sides, length, depth)
 
     t.hideturtle()
+    screen.update()
     # Keep window open
     turtle.done()
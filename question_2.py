@@ -1,8 +1,10 @@
 import os
 import glob
+import io
 import pandas as pd
 import numpy as np
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Configuration / constants ---
 TEMPERATURES_FOLDER = "temperatures"
@@ -16,17 +18,26 @@ MONTHS = [
     "July", "August", "September", "October", "November", "December"
 ]
 
-# Map months to Australian seasons
-SEASON_MAP = {
-    "December": "Summer", "January": "Summer", "February": "Summer",
-    "March": "Autumn", "April": "Autumn", "May": "Autumn",
-    "June": "Winter", "July": "Winter", "August": "Winter",
-    "September": "Spring", "October": "Spring", "November": "Spring"
+# Australian seasons and their months
+SEASON_MONTHS = {
+    "Summer": ["December", "January", "February"],
+    "Autumn": ["March", "April", "May"],
+    "Winter": ["June", "July", "August"],
+    "Spring": ["September", "October", "November"],
 }
 
 
 SEASON_ORDER = ["Summer", "Autumn", "Winter", "Spring"]
 
+# Columns we actually use, matched case-insensitively so the fast reader
+# can skip everything else (lat/lon etc.) at parse time.
+_VALID_COLS = {m.lower() for m in MONTHS} | {"stn_id", "station_name"}
+
+# Temperatures comfortably fit float32; dtype hints also let the C parser
+# skip per-column type inference. Keys that don't match a file's casing
+# are ignored, and to_numeric fixes those columns up later.
+_MONTH_DTYPES = {m: "float32" for m in MONTHS}
+
 
 def find_csv_files(folder):
     """Return list of .csv file paths under folder."""
@@ -36,9 +47,24 @@ def find_csv_files(folder):
 
 def safe_read_csv(path):
     """
-    Read a CSV.
+    Read a CSV with the fast C parser, falling back to delimiter
+    sniffing with the python engine for oddly formatted files.
     Return None on failure.
     """
+    try:
+        df = pd.read_csv(
+            path,
+            engine="c",
+            usecols=lambda c: c.lower() in _VALID_COLS,
+            dtype=_MONTH_DTYPES,
+        )
+        # a non-comma-delimited file "succeeds" as a single unrecognized
+        # column that usecols filters away; treat that as a parse failure
+        # so the delimiter sniffer below gets its chance
+        if df.shape[1]:
+            return df
+    except (OSError, ValueError, pd.errors.ParserError):
+        pass
     try:
         df = pd.read_csv(path, sep=None, engine="python")
         return df
@@ -47,23 +73,38 @@ def safe_read_csv(path):
         return None
 
 
-def normalize_month_columns(df):
+def _concat_csv_fragments(files):
     """
-    Ensure month columns exist in the dataframe and convert them to numeric.
+    Stream the bodies of same-schema CSV files into one in-memory buffer
+    so pandas pays its parse start-up cost once instead of once per file.
+    Files whose header line differs from the first file's are returned in
+    leftovers for individual parsing.
+    Returns (buffer, leftovers).
     """
-    present = []
-    col_map = {c.lower(): c for c in df.columns}
-    for m in MONTHS:
-        key = m.lower()
-        if key in col_map:
-            colname = col_map[key]
-            
-            df[colname] = pd.to_numeric(df[colname], errors="coerce")
-            # standardize the column name to canonical month name
-            if colname != m:
-                df = df.rename(columns={colname: m})
-            present.append(m)
-    return df, present
+    buf = io.BytesIO()
+    header = None
+    leftovers = []
+    for path in files:
+        try:
+            with open(path, "rb") as f:
+                first = f.readline()
+                if header is None:
+                    header = first.strip()
+                    buf.write(first)
+                    if not first.endswith(b"\n"):
+                        buf.write(b"\n")
+                elif first.strip() != header:
+                    leftovers.append(path)
+                    continue
+                body = f.read()
+                buf.write(body)
+                if body and not body.endswith(b"\n"):
+                    buf.write(b"\n")
+        except OSError:
+            # unreadable file: let safe_read_csv warn about it and move on
+            leftovers.append(path)
+    buf.seek(0)
+    return buf, leftovers
 
 
 def gather_all_data(files):
@@ -71,68 +112,100 @@ def gather_all_data(files):
     Read and concatenate all CSV files into one DataFrame.
     Returns (all_df, months_present).
     """
-    pieces = []
-    months_found = set()
-
-    for f in files:
-        df = safe_read_csv(f)
-        if df is None:
-            continue
-
-       
-        cols_lower = {c.lower(): c for c in df.columns}
-
-        if "stn_id" in cols_lower:
-            df = df.rename(columns={cols_lower["stn_id"]: "STN_ID"})
-        if "station_name" in cols_lower:
-            df = df.rename(columns={cols_lower["station_name"]: "STATION_NAME"})
-        # Normalize month columns and convert to numeric
-        df, present = normalize_month_columns(df)
-        months_found.update(present)
-
-
-        if "STN_ID" not in df.columns and "STATION_NAME" in df.columns:
-            df["STN_ID"] = df["STATION_NAME"].astype(str)
-
-
-        if "STATION_NAME" not in df.columns and "STN_ID" in df.columns:
-            df["STATION_NAME"] = df["STN_ID"].astype(str)
-
-        pieces.append(df)
-
-    if not pieces:
+    buf, leftovers = _concat_csv_fragments(files)
+    frames = []
+    try:
+        combined = pd.read_csv(
+            buf,
+            engine="c",
+            usecols=lambda c: c.lower() in _VALID_COLS,
+            dtype=_MONTH_DTYPES,
+        )
+    except (ValueError, pd.errors.ParserError):
+        combined = None
+    if combined is not None and combined.shape[1]:
+        frames.append(combined)
+    else:
+        # combined parse failed or found no recognized columns (e.g. the
+        # shared header used another delimiter); parse every file on its own
+        leftovers = list(files)
+
+    # parse leftover files in a thread pool: pandas' C parser releases the
+    # GIL, so file reads and parsing overlap across workers
+    if leftovers:
+        workers = min(32, (os.cpu_count() or 1) * 2, len(leftovers))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            frames.extend(df for df in ex.map(safe_read_csv, leftovers) if df is not None)
+
+    if not frames:
         return pd.DataFrame(), []
 
-    all_df = pd.concat(pieces, ignore_index=True, sort=False)
+    # lowercase every frame's columns so concat lines matching columns up,
+    # then do the canonical rename and numeric conversion once on the
+    # combined frame instead of per file
+    for df in frames:
+        df.columns = df.columns.str.lower()
+
+    all_df = pd.concat(frames, ignore_index=True, sort=False)
+    all_df.rename(
+        columns={
+            **{m.lower(): m for m in MONTHS},
+            "stn_id": "STN_ID",
+            "station_name": "STATION_NAME",
+        },
+        inplace=True,
+    )
+
+    months_present = [m for m in MONTHS if m in all_df.columns]
+    if months_present:
+        all_df[months_present] = all_df[months_present].apply(
+            pd.to_numeric, errors="coerce", downcast="float"
+        )
 
+    # fill in whichever identifier column is missing (or partially missing,
+    # when only some files carried it)
     if "STN_ID" not in all_df.columns:
-        all_df["STN_ID"] = all_df.index.astype(str)
+        if "STATION_NAME" in all_df.columns:
+            all_df["STN_ID"] = all_df["STATION_NAME"].astype(str)
+        else:
+            all_df["STN_ID"] = all_df.index.astype(str)
     if "STATION_NAME" not in all_df.columns:
         all_df["STATION_NAME"] = all_df["STN_ID"].astype(str)
+    if all_df["STN_ID"].isna().any():
+        all_df["STN_ID"] = all_df["STN_ID"].fillna(all_df["STATION_NAME"])
+    if all_df["STATION_NAME"].isna().any():
+        all_df["STATION_NAME"] = all_df["STATION_NAME"].fillna(all_df["STN_ID"])
+
+    # few stations, many readings: categorical ids let every downstream
+    # groupby hash small integer codes instead of the raw keys
+    all_df["STN_ID"] = all_df["STN_ID"].astype("category")
 
-    # List months present in canonical order
-    months_present = [m for m in MONTHS if m in months_found]
     return all_df, months_present
 
 
 # --- Analysis functions ---
 
 
-def compute_seasonal_averages(melted_df):
+def compute_seasonal_averages(all_df, months_present):
     """
-    melted_df must have columns: STN_ID, STATION_NAME, Month, Temp
+    Compute season -> mean_temp straight from the wide station x month
+    frame: the mean of each season is just np.nanmean over that season's
+    month columns, with no melted copy or per-row season lookup.
     Returns OrderedDict season -> mean_temp (float, NaN if no data)
     """
-    # Map month -> season
-    melted_df = melted_df.copy()
-    melted_df["Season"] = melted_df["Month"].map(SEASON_MAP)
-    # compute mean across all stations & years, ignoring NaN
-    season_means = melted_df.groupby("Season", observed=True)["Temp"].mean()
-    # return in the desired order
+    # one conversion to a 2D float32 array; each season is then just an
+    # integer column select plus nanmean over the slab
+    arr = all_df[months_present].to_numpy(dtype=np.float32, copy=False)
+    month_to_idx = {m: i for i, m in enumerate(months_present)}
+
     result = OrderedDict()
     for s in SEASON_ORDER:
-        val = season_means.get(s, np.nan)
-        result[s] = float(val) if not pd.isna(val) else np.nan
+        cols = [month_to_idx[m] for m in SEASON_MONTHS[s] if m in month_to_idx]
+        if not cols:
+            result[s] = np.nan
+            continue
+        vals = arr[:, cols]
+        result[s] = float(np.nanmean(vals)) if not np.isnan(vals).all() else np.nan
     return result
 
 
@@ -146,25 +219,33 @@ def compute_station_stats(melted_df):
     Stations with no numeric temp values are dropped.
     """
   
-    melted_df["Temp"] = pd.to_numeric(melted_df["Temp"], errors="coerce")
+    # keep temps in float32: half the memory traffic of float64 for every
+    # reduction below, at ~1e-4 degC precision, far finer than the data's
+    melted_df["Temp"] = pd.to_numeric(melted_df["Temp"], errors="coerce").astype(
+        "float32"
+    )
     # drop rows where Temp is NaN
     valid = melted_df.dropna(subset=["Temp"]).copy()
     if valid.empty:
         return pd.DataFrame()
 
-    def agg_func(g):
-        vals = g["Temp"].values.astype(float)
-        return pd.Series({
-            "STATION_NAME": g["STATION_NAME"].iloc[0],
-            "max_temp": np.nanmax(vals),
-            "min_temp": np.nanmin(vals),
-            "temp_range": np.nanmax(vals) - np.nanmin(vals),
-            "stddev": float(np.std(vals, ddof=0)),
-            "count_values": len(vals)
-        })
-
-    grouped = valid.groupby("STN_ID", sort=False).apply(agg_func)
-    return grouped
+    # single agg pass with pandas' built-in (Cython) reducers instead of a
+    # Python callback per group; the population std (ddof=0) is recovered
+    # vectorized from E[x^2] - E[x]^2 to stay on the fast path
+    valid["TempSq"] = valid["Temp"] ** 2
+    grouped = valid.groupby("STN_ID", sort=False, observed=True).agg(
+        STATION_NAME=("STATION_NAME", "first"),
+        max_temp=("Temp", "max"),
+        min_temp=("Temp", "min"),
+        mean_temp=("Temp", "mean"),
+        mean_sq=("TempSq", "mean"),
+        count_values=("Temp", "count"),
+    )
+    grouped["temp_range"] = grouped["max_temp"] - grouped["min_temp"]
+    grouped["stddev"] = np.sqrt(
+        (grouped["mean_sq"] - grouped["mean_temp"] ** 2).clip(lower=0)
+    )
+    return grouped.drop(columns=["mean_temp", "mean_sq"])
 
 
 def write_season_file(season_avgs, filename):
@@ -173,14 +254,12 @@ def write_season_file(season_avgs, filename):
      Summer: 28.5°C
     Order: Summer, Autumn, Winter, Spring
     """
+    lines = [
+        f"{s}: No data\n" if pd.isna(val) else f"{s}: {round(val, 1)}°C\n"
+        for s, val in ((s, season_avgs.get(s, np.nan)) for s in SEASON_ORDER)
+    ]
     with open(filename, "w", encoding="utf-8") as f:
-        for s in SEASON_ORDER:
-            val = season_avgs.get(s, np.nan)
-            if pd.isna(val):
-                line = f"{s}: No data\n"
-            else:
-                line = f"{s}: {round(val, 1)}°C\n"
-            f.write(line)
+        f.writelines(lines)
     print(f"Wrote seasonal averages to {filename}")
 
 
@@ -200,13 +279,16 @@ def write_range_file(station_stats_df, filename):
     # treat floating point ties exactly (we used the same computation so equality is fine)
     tied = station_stats_df[station_stats_df["temp_range"] == max_range]
 
+    # pull plain arrays and zip them rather than iterating Series rows
+    names = tied["STATION_NAME"].to_numpy()
+    rngs = tied["temp_range"].to_numpy(dtype=float).round(1)
+    mxs = tied["max_temp"].to_numpy(dtype=float).round(1)
+    mns = tied["min_temp"].to_numpy(dtype=float).round(1)
     with open(filename, "w", encoding="utf-8") as f:
-        for stn_id, row in tied.iterrows():
-            name = row["STATION_NAME"]
-            rng = round(row["temp_range"], 1)
-            mx = round(row["max_temp"], 1)
-            mn = round(row["min_temp"], 1)
-            f.write(f"Station {name}: Range {rng}°C (Max: {mx}°C, Min: {mn}°C)\n")
+        f.writelines(
+            f"Station {name}: Range {rng}°C (Max: {mx}°C, Min: {mn}°C)\n"
+            for name, rng, mx, mn in zip(names, rngs, mxs, mns)
+        )
     print(f"Wrote largest range results to {filename}")
 
 
@@ -231,15 +313,21 @@ def write_stability_file(station_stats_df, filename):
 
     with open(filename, "w", encoding="utf-8") as f:
         # Stable
-        for stn_id, row in most_stable.iterrows():
-            name = row["STATION_NAME"]
-            stdv = round(row["stddev"], 1)
-            f.write(f"Most Stable: Station {name}: StdDev {stdv}°C\n")
+        f.writelines(
+            f"Most Stable: Station {name}: StdDev {stdv}°C\n"
+            for name, stdv in zip(
+                most_stable["STATION_NAME"].to_numpy(),
+                most_stable["stddev"].to_numpy(dtype=float).round(1),
+            )
+        )
         # Variable
-        for stn_id, row in most_variable.iterrows():
-            name = row["STATION_NAME"]
-            stdv = round(row["stddev"], 1)
-            f.write(f"Most Variable: Station {name}: StdDev {stdv}°C\n")
+        f.writelines(
+            f"Most Variable: Station {name}: StdDev {stdv}°C\n"
+            for name, stdv in zip(
+                most_variable["STATION_NAME"].to_numpy(),
+                most_variable["stddev"].to_numpy(dtype=float).round(1),
+            )
+        )
     print(f"Wrote stability results to {filename}")
 
 
@@ -260,20 +348,20 @@ def main():
         print("No temperature columns found in the input files. Exiting.")
         return
 
-    # Prepare melted long-form dataframe: one row per station-month reading
-    value_vars = months_present
+    # Seasonal averages across all stations & years, straight off the wide frame
+    season_avgs = compute_seasonal_averages(all_df, months_present)
+    write_season_file(season_avgs, OUTPUT_SEASON_FILE)
+
+    # Melted long-form dataframe (one row per station-month reading)
+    # is still needed for the per-station stats below
     melted = pd.melt(
         all_df,
         id_vars=["STN_ID", "STATION_NAME"],
-        value_vars=value_vars,
+        value_vars=months_present,
         var_name="Month",
         value_name="Temp"
     )
 
-    # Seasonal averages across all stations & years
-    season_avgs = compute_seasonal_averages(melted)
-    write_season_file(season_avgs, OUTPUT_SEASON_FILE)
-
     # Station-level stats
     station_stats = compute_station_stats(melted)
     if station_stats.empty: